@@ -1,17 +1,23 @@
+import sys as _sys
 import typing as _t
 from functools import partial as _partial
-from heapq import (heapify as _heapify,
+from heapq import (_siftdown as _sift_down,  # type: ignore[attr-defined]
+                   _siftup as _sift_up,
+                   heapify as _heapify,
                    heappop as _heappop,
-                   heappush as _heappush)
+                   heappush as _heappush,
+                   heappushpop as _heappushpop,
+                   heapreplace as _heapreplace)
+from itertools import count as _count
+from operator import (attrgetter as _attrgetter,
+                      itemgetter as _itemgetter)
 
 import typing_extensions as _te
 from reprit.base import generate_repr as _generate_repr
 
 from .core.hints import (Key as _Key,
                          Value as _Value)
-from .core.item import Item as _Item
-from .core.order import (NaturalOrder as _NaturalOrder,
-                         ReversedOrder as _ReversedOrder)
+from .core.order import ReversedOrder as _ReversedOrder
 from .hints import SortingKey as _SortingKey
 
 
@@ -22,10 +28,13 @@ class PriorityQueue(_t.Generic[_Key, _Value]):
 
     Reference: https://en.wikipedia.org/wiki/Priority_queue
     """
-    _items: _t.List[_Item[_Key, _Value]]
-    _sorting_key: _SortingKey[_Value, _Key]
+    _is_plain: bool
+    _item_to_value: _t.Callable[[_t.Any], _Value]
+    _items: _t.List[_t.Any]
+    _value_to_item: _t.Callable[[_Value], _t.Any]
 
-    __slots__ = '_sorting_key', '_items', '_key', '_reverse'
+    __slots__ = ('_is_plain', '_item_to_value', '_items', '_key', '_reverse',
+                 '_value_to_item')
 
     def __init__(self,
                  *values: _Value,
@@ -53,17 +62,30 @@ class PriorityQueue(_t.Generic[_Key, _Value]):
         >>> queue.reverse
         True
         """
-        self._sorting_key = _t.cast(
-                _SortingKey[_Value, _Key],
-                (_ReversedOrder if reverse else _NaturalOrder)
-                if key is None
-                else (_partial(_to_reversed_key, key) if reverse else key)
-        )
-        self._items = [_Item(self._sorting_key(value), value)
-                       for value in values]
+        if key is None:
+            if reverse:
+                self._items = list(
+                    map(_ReversedOrder, values)  # type: ignore[arg-type]
+                )
+                self._value_to_item = _ReversedOrder
+                self._item_to_value = _reversed_order_value
+            else:
+                self._items = list(values)
+                self._value_to_item = self._item_to_value = _identity
+        else:
+            keys: _t.Iterable[_t.Any] = map(key, values)
+            if reverse:
+                keys = map(_ReversedOrder, keys)
+            indices = _count()
+            self._items = list(zip(keys, indices, values))
+            self._value_to_item = _to_indexed_item_factory(
+                    key, reverse, indices.__next__
+            )
+            self._item_to_value = _indexed_item_value
         _heapify(self._items)
+        self._is_plain = key is None and not reverse
         self._key = key
-        self._reverse = reverse
+        self._reverse = bool(reverse)
 
     __repr__ = _generate_repr(__init__)
 
@@ -90,10 +112,34 @@ class PriorityQueue(_t.Generic[_Key, _Value]):
         False
         >>> queue == PriorityQueue(*range(5))
         False
+        >>> queue == PriorityQueue(*range(10), key=abs)
+        False
+        >>> PriorityQueue() == PriorityQueue(key=abs, reverse=True)
+        True
+        >>> (PriorityQueue(*range(10), key=abs)
+        ...  == PriorityQueue(*range(10), key=lambda value: abs(value)))
+        True
         """
-        return (self is other or self._items == other._items
-                if isinstance(other, PriorityQueue)
-                else NotImplemented)
+        if not isinstance(other, PriorityQueue):
+            return NotImplemented
+        elif self is other:
+            return True
+        elif len(self._items) != len(other._items):
+            return False
+        elif not self._items:
+            return True
+        elif (self._reverse is not other._reverse
+              or (self._key is None) is not (other._key is None)):
+            return False
+        elif self._items == other._items:
+            return True
+        front_value, other_front_value = self.peek(), other.peek()
+        if not (front_value is other_front_value
+                or front_value == other_front_value):
+            return False
+        elif self._key is None:
+            return self._to_sorted_values() == other._to_sorted_values()
+        return self._to_keyed_values() == other._to_keyed_values()
 
     def __len__(self) -> int:
         """
@@ -107,6 +153,51 @@ class PriorityQueue(_t.Generic[_Key, _Value]):
         """
         return len(self._items)
 
+    def __reduce__(self) -> _t.Tuple[_t.Any, ...]:
+        """
+        Returns data for pickling/copying the queue.
+
+        Complexity: O(len(self) * log len(self)).
+
+        >>> import pickle
+        >>> queue = PriorityQueue(*range(5))
+        >>> pickle.loads(pickle.dumps(queue)) == queue
+        True
+        """
+        return (_partial(type(self),
+                         key=self._key,
+                         reverse=self._reverse),
+                tuple(self._to_sorted_values()))
+
+    def __sizeof__(self) -> int:
+        """
+        Returns size of the queue in memory in bytes
+        excluding values and their keys themselves.
+
+        Complexity: O(1) if the queue has no key and is not reversed,
+        O(len(self)) otherwise.
+
+        >>> import sys
+        >>> queue = PriorityQueue(*range(5))
+        >>> sys.getsizeof(queue) > sys.getsizeof(PriorityQueue())
+        True
+        """
+        items = self._items
+        result = object.__sizeof__(self) + items.__sizeof__()
+        if self._is_plain:
+            return result
+        result += sum(map(_sys.getsizeof, items))
+        if self._key is not None:
+            # small integers are cached and shared by the interpreter,
+            # so only larger indices are owned by the queue
+            result += sum(_sys.getsizeof(index)
+                          for index in map(_indexed_item_index, items)
+                          if index > _MAX_CACHED_INTEGER)
+            if self._reverse:
+                result += sum(map(_sys.getsizeof,
+                                  map(_indexed_item_key, items)))
+        return result
+
     @property
     def key(self) -> _t.Optional[_SortingKey[_Value, _Key]]:
         return self._key
@@ -128,6 +219,30 @@ class PriorityQueue(_t.Generic[_Key, _Value]):
         """
         self._items.clear()
 
+    def extend(self, values: _t.Iterable[_Value]) -> None:
+        """
+        Adds values to the queue.
+
+        Complexity: O(min(len(self) + len(values),
+                          len(values) * log(len(self) + len(values)))).
+
+        >>> queue = PriorityQueue(*range(5))
+        >>> queue.extend([-1, 10])
+        >>> queue
+        PriorityQueue(-1, 0, 1, 2, 3, 4, 10, key=None, reverse=False)
+        """
+        new_items = (list(values)
+                     if self._is_plain
+                     else list(map(self._value_to_item, values)))
+        items = self._items
+        size = len(items) + len(new_items)
+        if len(new_items) * size.bit_length() > size:
+            items.extend(new_items)
+            _heapify(items)
+        else:
+            for item in new_items:
+                _heappush(items, item)
+
     def peek(self) -> _Value:
         """
         Returns front value of the queue.
@@ -149,7 +264,7 @@ class PriorityQueue(_t.Generic[_Key, _Value]):
         except IndexError:
             raise ValueError('Priority queue is empty') from None
         else:
-            return item.value
+            return item if self._is_plain else self._item_to_value(item)
 
     def pop(self) -> _Value:
         """
@@ -167,7 +282,8 @@ class PriorityQueue(_t.Generic[_Key, _Value]):
         >>> queue
         PriorityQueue(2, 3, 4, key=None, reverse=False)
         """
-        return _heappop(self._items).value
+        item = _heappop(self._items)
+        return item if self._is_plain else self._item_to_value(item)
 
     def push(self, value: _Value) -> None:
         """
@@ -183,7 +299,30 @@ class PriorityQueue(_t.Generic[_Key, _Value]):
         >>> queue
         PriorityQueue(-1, 0, 1, 2, 3, 4, 10, key=None, reverse=False)
         """
-        _heappush(self._items, _Item(self._sorting_key(value), value))
+        _heappush(self._items,
+                  value if self._is_plain else self._value_to_item(value))
+
+    def pushpop(self, value: _Value) -> _Value:
+        """
+        Adds value to the queue and pops front value from it.
+
+        Complexity: O(log len(self)).
+
+        >>> queue = PriorityQueue(*range(5))
+        >>> queue.pushpop(-1)
+        -1
+        >>> queue
+        PriorityQueue(0, 1, 2, 3, 4, key=None, reverse=False)
+        >>> queue.pushpop(10)
+        0
+        >>> queue
+        PriorityQueue(1, 2, 3, 4, 10, key=None, reverse=False)
+        """
+        if self._is_plain:
+            return _t.cast(_Value, _heappushpop(self._items, value))
+        else:
+            item = self._value_to_item(value)
+            return self._item_to_value(_heappushpop(self._items, item))
 
     def remove(self, value: _Value) -> None:
         """
@@ -199,27 +338,106 @@ class PriorityQueue(_t.Generic[_Key, _Value]):
         >>> queue
         PriorityQueue(1, 2, 3, key=None, reverse=False)
         """
+        items = self._items
         try:
-            self._items.remove(_Item(self._sorting_key(value), value))
+            index = self._index(value)
         except ValueError:
             raise ValueError('{!r} is not in priority queue'
                              .format(value)) from None
+        last_item = items.pop()
+        if index < len(items):
+            items[index] = last_item
+            _sift_up(items, index)
+            _sift_down(items, 0, index)
+
+    def replace(self, value: _Value) -> _Value:
+        """
+        Pops front value from the queue and adds value to it.
+
+        Complexity: O(log len(self)).
+
+        >>> queue = PriorityQueue(*range(5))
+        >>> queue.replace(10)
+        0
+        >>> queue
+        PriorityQueue(1, 2, 3, 4, 10, key=None, reverse=False)
+        >>> queue.replace(-1)
+        1
+        >>> queue
+        PriorityQueue(-1, 2, 3, 4, 10, key=None, reverse=False)
+        """
+        if self._is_plain:
+            return _t.cast(_Value, _heapreplace(self._items, value))
         else:
-            _heapify(self._items)
+            item = self._value_to_item(value)
+            return self._item_to_value(_heapreplace(self._items, item))
 
     def values(self) -> _t.List[_Value]:
         """
         Returns elements of the queue.
 
-        Complexity: O(len(self) * log len(self)).
+        Complexity: O(len(self) * log len(self)),
+        O(len(self)) if the queue was not modified since the previous call.
 
         >>> queue = PriorityQueue(*range(5))
         >>> queue.values()
         [0, 1, 2, 3, 4]
         """
-        return [item.value for item in sorted(self._items)]
-
-
-def _to_reversed_key(key: _SortingKey[_Value, _Key],
-                     value: _Value) -> _ReversedOrder[_Key]:
-    return _ReversedOrder(key(value))
+        # sorted list is a valid heap, so keeping it makes
+        # subsequent calls linear until the queue gets modified
+        items = self._items = sorted(self._items)
+        return (items[:]
+                if self._is_plain
+                else list(map(self._item_to_value, items)))
+
+    def _index(self, value: _Value) -> int:
+        if self._key is None:
+            return self._items.index(self._value_to_item(value))
+        value_key = _MISSING
+        for index, (item_key, _, item_value) in enumerate(self._items):
+            if item_value == value:
+                if value_key is _MISSING:
+                    value_key, _, _ = self._value_to_item(value)
+                if item_key == value_key:
+                    return index
+        raise ValueError(value)
+
+    def _to_keyed_values(self) -> _t.List[_t.Tuple[_t.Any, _Value]]:
+        return [(key, value) for key, _, value in sorted(self._items)]
+
+    def _to_sorted_values(self) -> _t.List[_Value]:
+        items = sorted(self._items)
+        return (items
+                if self._is_plain
+                else list(map(self._item_to_value, items)))
+
+
+_MAX_CACHED_INTEGER = 256
+_MISSING = object()
+_indexed_item_index = _itemgetter(1)
+_indexed_item_key = _itemgetter(0)
+_indexed_item_value = _itemgetter(2)
+_reversed_order_value = _attrgetter('_value')
+
+
+def _identity(value: _Value) -> _Value:
+    return value
+
+
+def _to_indexed_item_factory(
+        key: _SortingKey[_Value, _Key],
+        reverse: bool,
+        next_index: _t.Callable[[], int]
+) -> _t.Callable[[_Value], _t.Tuple[_t.Any, int, _Value]]:
+    if reverse:
+        def to_reversed_indexed_item(
+                value: _Value
+        ) -> _t.Tuple[_ReversedOrder[_Key], int, _Value]:
+            return _ReversedOrder(key(value)), next_index(), value
+
+        return to_reversed_indexed_item
+
+    def to_indexed_item(value: _Value) -> _t.Tuple[_Key, int, _Value]:
+        return key(value), next_index(), value
+
+    return to_indexed_item
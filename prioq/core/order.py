@@ -9,41 +9,6 @@ _T = _t.TypeVar('_T',
                 bound=Ordered)
 
 
-class NaturalOrder(_t.Generic[_T]):
-    __slots__ = '_value',
-
-    def __init__(self, _value: _T) -> None:
-        self._value = _value
-
-    __repr__ = generate_repr(__init__)
-
-    @_t.overload
-    def __eq__(self, other: _te.Self) -> bool:
-        ...
-
-    @_t.overload
-    def __eq__(self, other: _t.Any) -> _t.Any:
-        ...
-
-    def __eq__(self, other: _t.Any) -> _t.Any:
-        return (self._value == other._value
-                if isinstance(other, NaturalOrder)
-                else NotImplemented)
-
-    @_t.overload
-    def __lt__(self, other: _te.Self) -> bool:
-        ...
-
-    @_t.overload
-    def __lt__(self, other: _t.Any) -> _t.Any:
-        ...
-
-    def __lt__(self, other: _t.Any) -> _t.Any:
-        return (self._value < other._value
-                if isinstance(other, NaturalOrder)
-                else NotImplemented)
-
-
 class ReversedOrder(_t.Generic[_T]):
     __slots__ = '_value',
 
@@ -62,7 +27,7 @@ class ReversedOrder(_t.Generic[_T]):
 
     def __eq__(self, other: _t.Any) -> _t.Any:
         return (self._value == other._value
-                if isinstance(other, ReversedOrder)
+                if type(other) is ReversedOrder
                 else NotImplemented)
 
     @_t.overload
@@ -75,5 +40,5 @@ class ReversedOrder(_t.Generic[_T]):
 
     def __lt__(self, other: _t.Any) -> _t.Any:
         return (other._value < self._value
-                if isinstance(other, ReversedOrder)
+                if type(other) is ReversedOrder
                 else NotImplemented)
@@ -17,6 +17,10 @@ settings.register_profile('default',
                                     else None),
                           max_examples=max_examples,
                           suppress_health_check=[HealthCheck.too_slow])
+settings.register_profile('dev',
+                          deadline=None,
+                          max_examples=-(-max_examples // 4),
+                          suppress_health_check=[HealthCheck.too_slow])
 
 
 @pytest.hookimpl(trylast=True)
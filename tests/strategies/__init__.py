@@ -3,6 +3,7 @@ from .base import (booleans,
                    empty_priority_queues_with_values,
                    non_empty_priority_queues,
                    non_empty_priority_queues_with_their_values,
+                   non_empty_priority_queues_with_values,
                    priority_queues,
                    priority_queues_pairs,
                    priority_queues_triplets,
@@ -72,6 +72,10 @@ single_values_with_keys = (
     values_with_keys_strategies.flatmap(partial(to_values_lists_with_keys,
                                                 sizes=[(1, 1)]))
 )
+two_or_more_values_lists_with_keys = (
+    values_with_keys_strategies.flatmap(partial(to_values_lists_with_keys,
+                                                sizes=[(2, None)]))
+)
 priority_queues = _st.builds(to_priority_queue, values_lists_with_keys,
                              booleans)
 empty_priority_queues = _st.builds(to_priority_queue,
@@ -86,6 +90,10 @@ priority_queues_with_values = _st.builds(
 empty_priority_queues_with_values = _st.builds(
         to_priority_queue_with_value, single_values_with_keys, booleans
 )
+non_empty_priority_queues_with_values = _st.builds(
+        to_priority_queue_with_value, two_or_more_values_lists_with_keys,
+        booleans
+)
 non_empty_priority_queues_with_their_values = (
     non_empty_priority_queues.flatmap(to_priority_queues_with_their_values)
 )
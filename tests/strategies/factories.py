@@ -84,4 +84,5 @@ def to_priority_queues_with_their_values(
         queue: PriorityQueue
 ) -> Strategy[Tuple[PriorityQueue, Value]]:
     return strategies.tuples(strategies.just(queue),
-                             strategies.sampled_from(queue.values()))
+                             strategies.sampled_from(queue._items)
+                             .map(queue._item_to_value))
@@ -8,15 +8,21 @@ from tests import strategies
 
 @given(strategies.priority_queues)
 def test_shallow(priority_queue: PriorityQueue) -> None:
+    items = priority_queue._items[:]
+
     result = copy.copy(priority_queue)
 
     assert result is not priority_queue
     assert result == priority_queue
+    assert priority_queue._items == items
 
 
 @given(strategies.priority_queues)
 def test_deep(priority_queue: PriorityQueue) -> None:
+    items = priority_queue._items[:]
+
     result = copy.deepcopy(priority_queue)
 
     assert result is not priority_queue
     assert result == priority_queue
+    assert priority_queue._items == items
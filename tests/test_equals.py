@@ -5,7 +5,8 @@ from tests import strategies
 from tests.utils import (PriorityQueuesPair,
                          PriorityQueuesTriplet,
                          equivalence,
-                         implication)
+                         implication,
+                         to_sorting_key)
 
 
 @given(strategies.priority_queues)
@@ -16,9 +17,12 @@ def test_reflexivity(priority_queue: PriorityQueue) -> None:
 @given(strategies.priority_queues_pairs)
 def test_symmetry(priority_queues_pair: PriorityQueuesPair) -> None:
     first_queue, second_queue = priority_queues_pair
+    first_items, second_items = first_queue._items[:], second_queue._items[:]
 
     assert equivalence(first_queue == second_queue,
                        second_queue == first_queue)
+    assert first_queue._items == first_items
+    assert second_queue._items == second_items
 
 
 @given(strategies.priority_queues_triplets)
@@ -37,3 +41,22 @@ def test_connection_with_inequality(priority_queues_pair: PriorityQueuesPair
 
     assert equivalence(not first_queue == second_queue,
                        first_queue != second_queue)
+
+
+@given(strategies.non_empty_priority_queues)
+def test_keys(priority_queue: PriorityQueue) -> None:
+    values = priority_queue.values()
+    sorting_key = to_sorting_key(priority_queue)
+
+    result = PriorityQueue(*values,
+                           key=lambda value: sorting_key(value),
+                           reverse=priority_queue.reverse)
+
+    assert equivalence(priority_queue == result,
+                       priority_queue.key is not None)
+
+
+@given(strategies.empty_priority_queues, strategies.empty_priority_queues)
+def test_empty(first_queue: PriorityQueue,
+               second_queue: PriorityQueue) -> None:
+    assert first_queue == second_queue
@@ -0,0 +1,45 @@
+from copy import deepcopy
+from typing import Tuple
+
+from hypothesis import given
+
+from prioq.base import PriorityQueue
+from prioq.hints import Value
+from tests import strategies
+from tests.utils import (PriorityQueuesPair,
+                         is_heap)
+
+
+@given(strategies.priority_queues_pairs)
+def test_basic(priority_queues_pair: PriorityQueuesPair) -> None:
+    first_queue, second_queue = priority_queues_pair
+
+    result = first_queue.extend(second_queue.values())
+
+    assert result is None
+
+
+@given(strategies.priority_queues_pairs)
+def test_properties(priority_queues_pair: PriorityQueuesPair) -> None:
+    first_queue, second_queue = priority_queues_pair
+    original = deepcopy(first_queue)
+
+    first_queue.extend(second_queue.values())
+
+    for value in second_queue.values():
+        original.push(value)
+    assert is_heap(first_queue._items)
+    assert first_queue == original
+
+
+@given(strategies.priority_queues_with_values)
+def test_step(priority_queue_with_value: Tuple[PriorityQueue, Value]
+              ) -> None:
+    priority_queue, value = priority_queue_with_value
+    original = deepcopy(priority_queue)
+
+    priority_queue.extend([value])
+
+    original.push(value)
+    assert is_heap(priority_queue._items)
+    assert priority_queue == original
@@ -1,3 +1,4 @@
+from collections import Counter
 from typing import (List,
                     Optional,
                     Tuple)
@@ -20,6 +21,23 @@ def test_basic(values_with_key: Tuple[List[Value], Optional[SortingKey]],
                            reverse=reverse)
 
     assert len(result) == len(values)
-    assert all(value in result.values() for value in values)
+    assert Counter(result.values()) == Counter(values)
     assert result.key is key
     assert result.reverse is reverse
+    assert not hasattr(result, '__dict__')
+
+
+@given(strategies.values_lists_with_keys, strategies.booleans)
+def test_reverse_flag(values_with_key: Tuple[List[Value],
+                                             Optional[SortingKey]],
+                      reverse: bool) -> None:
+    values, key = values_with_key
+
+    result = PriorityQueue(*values,
+                           key=key,
+                           reverse=int(reverse))
+
+    assert result.reverse is reverse
+    assert result == PriorityQueue(*values,
+                                   key=key,
+                                   reverse=reverse)
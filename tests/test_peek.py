@@ -3,6 +3,8 @@ from hypothesis import given
 
 from prioq.base import PriorityQueue
 from tests import strategies
+from tests.utils import (to_precedence,
+                         to_sorting_key)
 
 
 @given(strategies.empty_priority_queues)
@@ -16,5 +18,8 @@ def test_step(priority_queue: PriorityQueue) -> None:
     result = priority_queue.peek()
 
     assert result in priority_queue.values()
-    assert all(not item.key < priority_queue._sorting_key(result)
-               for item in priority_queue._items)
+    sorting_key = to_sorting_key(priority_queue)
+    precedes = to_precedence(priority_queue)
+    result_key = sorting_key(result)
+    assert all(not precedes(sorting_key(value), result_key)
+               for value in priority_queue.values())
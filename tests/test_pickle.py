@@ -7,4 +7,7 @@ from tests.utils import pickle_round_trip
 
 @given(strategies.priority_queues)
 def test_round_trip(priority_queue: PriorityQueue) -> None:
+    items = priority_queue._items[:]
+
     assert pickle_round_trip(priority_queue) == priority_queue
+    assert priority_queue._items == items
@@ -1,10 +1,10 @@
-from copy import deepcopy
-
 import pytest
 from hypothesis import given
 
 from prioq.base import PriorityQueue
 from tests import strategies
+from tests.utils import (to_precedence,
+                         to_sorting_key)
 
 
 @given(strategies.empty_priority_queues)
@@ -15,10 +15,13 @@ def test_base_case(priority_queue: PriorityQueue) -> None:
 
 @given(strategies.non_empty_priority_queues)
 def test_step(priority_queue: PriorityQueue) -> None:
-    original = deepcopy(priority_queue)
+    original_size = len(priority_queue)
 
     result = priority_queue.pop()
 
-    assert all(not item.key < priority_queue._sorting_key(result)
-               for item in priority_queue._items)
-    assert len(priority_queue) == len(original) - 1
+    sorting_key = to_sorting_key(priority_queue)
+    precedes = to_precedence(priority_queue)
+    result_key = sorting_key(result)
+    assert all(not precedes(sorting_key(value), result_key)
+               for value in priority_queue.values())
+    assert len(priority_queue) == original_size - 1
@@ -0,0 +1,36 @@
+from copy import deepcopy
+from typing import Tuple
+
+from hypothesis import given
+
+from prioq.base import PriorityQueue
+from prioq.hints import Value
+from tests import strategies
+from tests.utils import is_heap
+
+
+@given(strategies.priority_queues_with_values)
+def test_basic(priority_queue_with_value: Tuple[PriorityQueue, Value]) -> None:
+    priority_queue, value = priority_queue_with_value
+    original = deepcopy(priority_queue)
+
+    result = priority_queue.pushpop(value)
+
+    assert result in original.values() or result == value
+    assert len(priority_queue) == len(original)
+    assert is_heap(priority_queue._items)
+
+
+@given(strategies.priority_queues_with_values)
+def test_properties(
+        priority_queue_with_value: Tuple[PriorityQueue, Value]
+) -> None:
+    priority_queue, value = priority_queue_with_value
+    original = deepcopy(priority_queue)
+
+    result = priority_queue.pushpop(value)
+
+    assert is_heap(priority_queue._items)
+    original.push(value)
+    assert result == original.pop()
+    assert priority_queue == original
@@ -1,4 +1,3 @@
-from copy import deepcopy
 from typing import Tuple
 
 import pytest
@@ -7,6 +6,7 @@ from hypothesis import given
 from prioq.base import PriorityQueue
 from prioq.hints import Value
 from tests import strategies
+from tests.utils import is_heap
 
 
 @given(strategies.empty_priority_queues_with_values)
@@ -21,8 +21,18 @@ def test_base_case(priority_queue_with_value: Tuple[PriorityQueue, Value]
 @given(strategies.non_empty_priority_queues_with_their_values)
 def test_step(priority_queue_with_value: Tuple[PriorityQueue, Value]) -> None:
     priority_queue, value = priority_queue_with_value
-    original = deepcopy(priority_queue)
+    original_size = len(priority_queue)
 
     priority_queue.remove(value)
 
-    assert len(priority_queue) == len(original) - 1
+    assert len(priority_queue) == original_size - 1
+    assert is_heap(priority_queue._items)
+
+
+def test_moving_up() -> None:
+    priority_queue = PriorityQueue(0, 10, 1, 11, 12, 2, 3)
+
+    priority_queue.remove(11)
+
+    assert priority_queue._items == [0, 3, 1, 10, 12, 2]
+    assert is_heap(priority_queue._items)
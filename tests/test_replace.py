@@ -0,0 +1,32 @@
+from copy import deepcopy
+from typing import Tuple
+
+import pytest
+from hypothesis import given
+
+from prioq.base import PriorityQueue
+from prioq.hints import Value
+from tests import strategies
+from tests.utils import is_heap
+
+
+@given(strategies.empty_priority_queues_with_values)
+def test_base_case(priority_queue_with_value: Tuple[PriorityQueue, Value]
+                   ) -> None:
+    priority_queue, value = priority_queue_with_value
+
+    with pytest.raises(IndexError):
+        priority_queue.replace(value)
+
+
+@given(strategies.non_empty_priority_queues_with_values)
+def test_step(priority_queue_with_value: Tuple[PriorityQueue, Value]) -> None:
+    priority_queue, value = priority_queue_with_value
+    original = deepcopy(priority_queue)
+
+    result = priority_queue.replace(value)
+
+    assert is_heap(priority_queue._items)
+    assert result == original.pop()
+    original.push(value)
+    assert priority_queue == original
@@ -0,0 +1,59 @@
+import sys
+from typing import Tuple
+
+from hypothesis import given
+
+from prioq.base import PriorityQueue
+from prioq.hints import Value
+from tests import strategies
+from tests.utils import (equivalence,
+                         implication)
+
+
+@given(strategies.priority_queues)
+def test_basic(priority_queue: PriorityQueue) -> None:
+    result = sys.getsizeof(priority_queue)
+
+    assert isinstance(result, int)
+    assert result > sys.getsizeof(priority_queue._items)
+
+
+@given(strategies.non_empty_priority_queues)
+def test_entries(priority_queue: PriorityQueue) -> None:
+    plain_queue = PriorityQueue(*[0] * len(priority_queue))
+
+    result = (sys.getsizeof(priority_queue)
+              - sys.getsizeof(priority_queue._items))
+
+    assert equivalence(result > (sys.getsizeof(plain_queue)
+                                 - sys.getsizeof(plain_queue._items)),
+                       priority_queue.key is not None
+                       or priority_queue.reverse)
+
+
+@given(strategies.non_empty_priority_queues)
+def test_reverse(priority_queue: PriorityQueue) -> None:
+    values = priority_queue.values()
+    reversed_queue, straight_queue = (
+        PriorityQueue(*values,
+                      key=priority_queue.key,
+                      reverse=reverse)
+        for reverse in (True, False)
+    )
+
+    assert sys.getsizeof(reversed_queue) > sys.getsizeof(straight_queue)
+
+
+@given(strategies.priority_queues_with_values)
+def test_step(priority_queue_with_value: Tuple[PriorityQueue, Value]
+              ) -> None:
+    priority_queue, value = priority_queue_with_value
+    size = sys.getsizeof(priority_queue)
+
+    priority_queue.push(value)
+
+    result = sys.getsizeof(priority_queue)
+    assert result >= size
+    assert implication(priority_queue.key is not None
+                       or priority_queue.reverse,
+                       result > size)
@@ -0,0 +1,27 @@
+from hypothesis import given
+
+from prioq.base import PriorityQueue
+from tests import strategies
+from tests.utils import (is_heap,
+                         to_precedence,
+                         to_sorting_key)
+
+
+@given(strategies.priority_queues)
+def test_basic(priority_queue: PriorityQueue) -> None:
+    result = priority_queue.values()
+
+    assert isinstance(result, list)
+    assert len(result) == len(priority_queue)
+
+
+@given(strategies.priority_queues)
+def test_properties(priority_queue: PriorityQueue) -> None:
+    result = priority_queue.values()
+
+    sorting_key = to_sorting_key(priority_queue)
+    precedes = to_precedence(priority_queue)
+    assert all(not precedes(sorting_key(next_value), sorting_key(value))
+               for value, next_value in zip(result, result[1:]))
+    assert is_heap(priority_queue._items)
+    assert priority_queue.values() == result
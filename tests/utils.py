@@ -1,5 +1,8 @@
 import pickle
+from operator import (gt,
+                      lt)
 from typing import (Any,
+                    Callable,
                     Iterable,
                     List,
                     Optional,
@@ -8,7 +11,8 @@ from typing import (Any,
 from hypothesis.strategies import SearchStrategy
 
 from prioq.base import PriorityQueue
-from prioq.hints import (SortingKey,
+from prioq.hints import (Key,
+                         SortingKey,
                          Value)
 
 Strategy = SearchStrategy
@@ -36,5 +40,19 @@ def identity(value: Value) -> Value:
     return value
 
 
+def is_heap(items: List[Any]) -> bool:
+    return all(not items[index] < items[(index - 1) // 2]
+               for index in range(1, len(items)))
+
+
+def to_sorting_key(priority_queue: PriorityQueue) -> SortingKey:
+    key = priority_queue.key
+    return identity if key is None else key
+
+
+def to_precedence(priority_queue: PriorityQueue) -> Callable[[Key, Key], bool]:
+    return gt if priority_queue.reverse else lt
+
+
 def pickle_round_trip(object_: Value) -> Value:
     return pickle.loads(pickle.dumps(object_))